@@ -0,0 +1,120 @@
+"""
+Latest-state WorkItem data shared by the progress scripts.
+
+progress_analysis and progress_visualization both need the latest state of
+every (apartment, category, location) scope. It is loaded once per process
+and reused; call invalidate_cache() after writing to the DB (e.g. from a
+notebook that also runs the fix_* scripts) to force a reload.
+"""
+
+import threading
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from db_utils import get_conn, iter_read_sql
+
+STATUS_MAP = {
+    'COMPLETED': 'OK',
+    'COMPLETED_OK': 'OK',
+    'DEFECT': 'DEFECT',
+    'NOT_OK': 'DEFECT',
+    'IN_PROGRESS': 'PENDING',
+    'PENDING': 'PENDING',
+}
+
+# Fixed categories so every state gets a column, even with no items in it
+STATE_DTYPE = pd.CategoricalDtype(['OK', 'DEFECT', 'PENDING'])
+
+# Status category code -> State category code (STATUS_MAP order)
+_STATUS_DTYPE = pd.CategoricalDtype(list(STATUS_MAP))
+_STATE_CODE_BY_STATUS = np.array(
+    [STATE_DTYPE.categories.get_loc(state) for state in STATUS_MAP.values()], dtype=np.int8
+)
+
+_LATEST_SQL = """
+    SELECT
+        a.number as apartmentNumber,
+        w.category,
+        w.location,
+        w.status,
+        r.reportDate
+    FROM WorkItem w
+    JOIN Report r ON w.reportId = r.id
+    LEFT JOIN Apartment a ON w.apartmentId = a.id
+    WHERE w.apartmentId IS NOT NULL
+    ORDER BY r.reportDate ASC
+"""
+
+# The shared connection is opened with check_same_thread=False
+_conn_lock = threading.Lock()
+
+# Rows fetched per chunk; only one chunk plus the per-scope survivors is held at once
+CHUNK_SIZE = 10_000
+
+
+def _with_state(df: pd.DataFrame) -> pd.DataFrame:
+    """Map status to State, dropping unexpected statuses (INFO)"""
+    # Mapped on the categorical codes; unknown statuses get code -1
+    status_codes = pd.Categorical(df['status'], dtype=_STATUS_DTYPE).codes
+    known = status_codes >= 0
+    df = df[known].copy()
+    df['State'] = pd.Categorical.from_codes(
+        _STATE_CODE_BY_STATUS[status_codes[known]], dtype=STATE_DTYPE
+    )
+    return df
+
+
+def _keep_latest(df: pd.DataFrame) -> pd.DataFrame:
+    """Keep the last report's row of every (apartment, category, location) scope"""
+    # dropna=False treats null location as a distinct "general" location for that category
+    return (
+        df.sort_values('reportDate', kind='stable')
+        .groupby(['apartmentNumber', 'category', 'location'], sort=False, dropna=False)
+        .tail(1)
+    )
+
+
+@lru_cache(maxsize=1)
+def load_latest() -> pd.DataFrame:
+    """
+    Return the latest known state of every work item scope.
+
+    The query result is streamed in chunks and each chunk is reduced to its
+    latest row per scope as it arrives, so memory is bounded by the number of
+    scopes rather than the number of work items. The result is cached, so
+    treat it as read-only (take a .copy() before modifying it).
+    """
+    with _conn_lock:
+        partials = [
+            _keep_latest(_with_state(chunk))
+            for chunk in iter_read_sql(get_conn(), _LATEST_SQL, chunksize=CHUNK_SIZE)
+        ]
+
+    # Chunks arrive in reportDate order, so reducing the survivors again merges them
+    return _keep_latest(pd.concat(partials, ignore_index=True))
+
+
+def invalidate_cache():
+    """Drop the cached latest-state frame so the next load re-reads the DB"""
+    load_latest.cache_clear()
+
+
+def readiness_summary(latest: pd.DataFrame) -> pd.DataFrame:
+    """Count OK/DEFECT/PENDING per apartment and add Total and Health_Score"""
+    # dropna=False keeps the unobserved state categories as all-zero columns
+    summary = pd.crosstab(
+        latest['apartmentNumber'], latest['State'].astype(STATE_DTYPE), dropna=False
+    )
+    counts = summary.to_numpy()
+
+    # Calculate Metrics
+    totals = counts.sum(axis=1)
+    ok = counts[:, 0].astype(float)
+    summary['Total'] = totals
+    summary['Health_Score'] = np.round(
+        np.divide(ok * 100, totals, out=np.full_like(ok, np.nan), where=totals > 0), 1
+    )
+
+    return summary
@@ -0,0 +1,71 @@
+"""
+Composite indexes for the Explore_Data read patterns.
+
+The Prisma schema only has single-column indexes, so the scripts' usual
+"WorkItem for apartment X / report Y" joins look up every WorkItem row after
+the index seek. These covering indexes let SQLite answer them from the index
+alone. Run once after a fresh migrate:
+
+    python _ensure_indexes.py
+
+The indexes are not part of the Prisma schema, so `prisma migrate dev` will
+report drift while they exist; `python _ensure_indexes.py --drop` removes them.
+"""
+
+import sqlite3
+import sys
+
+from db_utils import DB_PATH
+
+# (name, DDL) pairs
+INDEXES = [
+    # WorkItem for one report + apartment, covering the columns the scripts group on
+    ("idx_workitem_report",
+     'CREATE INDEX IF NOT EXISTS idx_workitem_report '
+     'ON "WorkItem"("reportId", "apartmentId", "category", "status")'),
+    # Date-range filters on Report that then join on its (non-rowid) text id
+    ("idx_report_date",
+     'CREATE INDEX IF NOT EXISTS idx_report_date ON "Report"("reportDate", "id")'),
+    # Apartment lookups by number alone (the Prisma key starts with projectId)
+    ("idx_apartment_number",
+     'CREATE INDEX IF NOT EXISTS idx_apartment_number ON "Apartment"("number", "id")'),
+]
+
+
+def ensure_indexes(conn) -> bool:
+    """
+    Create any missing indexes and refresh the planner statistics.
+
+    Returns True if something was created. ANALYZE only runs in that case,
+    so calling this on every startup is cheap.
+    """
+    existing = {
+        name for (name,) in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")
+    }
+    missing = [ddl for name, ddl in INDEXES if name not in existing]
+    if not missing:
+        return False
+    with conn:
+        for ddl in missing:
+            conn.execute(ddl)
+    conn.execute("ANALYZE")
+    return True
+
+
+def drop_indexes(conn):
+    """Remove the indexes again (e.g. before running Prisma migrations)"""
+    with conn:
+        for name, _ in INDEXES:
+            conn.execute(f"DROP INDEX IF EXISTS {name}")
+
+
+if __name__ == '__main__':
+    conn = sqlite3.connect(DB_PATH)
+    if '--drop' in sys.argv[1:]:
+        drop_indexes(conn)
+        print("Dropped Explore_Data indexes")
+    elif ensure_indexes(conn):
+        print("Created missing indexes and ran ANALYZE")
+    else:
+        print("All indexes already present")
+    conn.close()
@@ -0,0 +1,28 @@
+"""
+Keyphrases the dump/scan scripts flag in WorkItem descriptions: "partially
+done" (חלקית) and the missing LAN sockets split out of the electrical items.
+
+Compiled once at import; the same set is available as a regex for Python /
+pandas checks and as an INSTR expression for checks pushed into SQLite.
+"""
+
+import re
+
+KEYWORDS = ('חלקית', 'sockets', 'LAN')
+
+KEY_RE = re.compile('|'.join(map(re.escape, KEYWORDS)))
+
+
+def match_desc(s) -> bool:
+    """True if ``s`` contains any keyphrase (case-sensitive, None-safe)"""
+    return bool(s) and KEY_RE.search(s) is not None
+
+
+def sql_match(column: str) -> str:
+    """
+    SQL expression that is 1 when ``column`` contains any keyphrase and 0
+    otherwise (including NULL), matching ``match_desc``.
+    """
+    # The keywords are fixed literals without quotes, so inlining them is safe
+    instr = " OR ".join(f"INSTR({column}, '{k}') > 0" for k in KEYWORDS)
+    return f"COALESCE({instr}, 0)"
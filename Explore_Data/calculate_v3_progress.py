@@ -3,14 +3,35 @@ Calculate V3 Progress for Apartments 7 and 11
 Compares V2 vs V3 logic to show the impact of aligned defect detection
 """
 
+import re
 import sqlite3
+
+import numpy as np
 import pandas as pd
-from collections import defaultdict
+
+from db_utils import fast_read_sql
+
+try:
+    import ahocorasick  # pyahocorasick, optional
+except ImportError:
+    ahocorasick = None
+
+try:
+    from numba import njit  # optional, JIT-compiles the scoring kernel
+except ImportError:
+    njit = None
 
 # Connect to DB
 db_path = r'c:\Users\yoel\constructor\prisma\dev.db'
 conn = sqlite3.connect(db_path)
 
+# Same index names as the Prisma migrations, so this is a no-op on migrated DBs
+conn.executescript("""
+CREATE INDEX IF NOT EXISTS "WorkItem_apartmentId_idx" ON "WorkItem"("apartmentId");
+CREATE INDEX IF NOT EXISTS "WorkItem_reportId_idx" ON "WorkItem"("reportId");
+CREATE INDEX IF NOT EXISTS "Report_reportDate_idx" ON "Report"("reportDate");
+""")
+
 # Category weights (from progress-calculator-v2.ts)
 CATEGORY_WEIGHTS = {
     'ELECTRICAL': 1.2,
@@ -40,6 +61,43 @@ PROGRESS_THRESHOLDS = {
     'CATEGORY_GRADUATED': 90,
 }
 
+# Item progress per status for a repeat (not first-time) report with clean notes.
+# This is the single scoring table: PROGRESS_BY_CODE below is built from it,
+# and a completed item with issues in its notes scores COMPLETED_WITH_ISSUES.
+STATUS_PROGRESS = {
+    'COMPLETED_OK': PROGRESS_THRESHOLDS['VERIFIED_NO_DEFECTS'],
+    'COMPLETED': PROGRESS_THRESHOLDS['COMPLETED_OK_LATER'],
+    'HANDLED': PROGRESS_THRESHOLDS['HANDLED'],
+    'DEFECT': PROGRESS_THRESHOLDS['DEFECT_WORK_DONE'],
+    'NOT_OK': PROGRESS_THRESHOLDS['DEFECT_WORK_DONE'],
+    'IN_PROGRESS': PROGRESS_THRESHOLDS['IN_PROGRESS'],
+    'PENDING': PROGRESS_THRESHOLDS['PENDING'],
+    'NOT_STARTED': PROGRESS_THRESHOLDS['NOT_STARTED'],
+}
+
+NEGATIVE_STATUSES = ['DEFECT', 'NOT_OK']
+POSITIVE_STATUSES = ['COMPLETED', 'COMPLETED_OK', 'HANDLED']
+
+# Fixed status categories for vectorized scoring: masks and progress lookups
+# index small per-code tables instead of comparing strings per row.
+# Unknown statuses get code -1, which indexes the trailing slot of each table.
+STATUS_CATEGORIES = NEGATIVE_STATUSES + POSITIVE_STATUSES + ['IN_PROGRESS', 'PENDING', 'NOT_STARTED']
+DEFECT_CODE = STATUS_CATEGORIES.index('DEFECT')
+PROGRESS_BY_CODE = np.array(
+    [STATUS_PROGRESS[s] for s in STATUS_CATEGORIES] + [PROGRESS_THRESHOLDS['UNKNOWN']],
+    dtype=np.int64,
+)
+
+def _code_mask(statuses):
+    """Boolean table indexed by status code, True for the given statuses"""
+    mask = np.zeros(len(STATUS_CATEGORIES) + 1, dtype=np.bool_)
+    mask[[STATUS_CATEGORIES.index(s) for s in statuses]] = True
+    return mask
+
+IS_NEGATIVE_CODE = _code_mask(NEGATIVE_STATUSES)
+IS_POSITIVE_CODE = _code_mask(POSITIVE_STATUSES)
+IS_COMPLETED_CODE = _code_mask(['COMPLETED', 'COMPLETED_OK'])
+
 # Negative keywords (from status-mapper.ts)
 NEGATIVE_KEYWORDS = [
     'אי תיאומים', 'אי תאומים', 'נמצאו אי', 'קיימים אי',
@@ -51,173 +109,157 @@ NEGATIVE_KEYWORDS = [
     'נזק', 'נזקים', 'missing', 'defect', 'חתוך', 'להחליף',
 ]
 
-def has_negative_notes_v2(notes):
-    """V2 logic - check if notes contain negative keywords"""
-    if not notes:
-        return False
-    notes_lower = notes.lower()
-    return any(keyword.lower() in notes_lower for keyword in NEGATIVE_KEYWORDS)
+# Keywords are matched against lowercased notes, so the text is casefolded
+# once up front instead of per keyword. All keywords form one alternation, so
+# a single regex scan tests every keyword. Longer keywords go first so that
+# overlapping ones (ליקוי / ליקויים) don't make the engine backtrack.
+# Notes repeat heavily across items, so score_items scans each distinct note
+# only once and broadcasts the result back to the rows.
+_NEG_RE = re.compile('|'.join(
+    sorted((re.escape(k.lower()) for k in NEGATIVE_KEYWORDS), key=len, reverse=True)
+))
 
-def is_negative_status(status):
-    """Check if status is explicitly negative"""
-    return status in ['DEFECT', 'NOT_OK']
+# When pyahocorasick is installed, score_items walks a single Aho-Corasick
+# automaton over each distinct note instead: one pass over the text
+# regardless of keyword count
+_NEG_AUTOMATON = None
+if ahocorasick is not None:
+    _NEG_AUTOMATON = ahocorasick.Automaton()
+    for _kw in NEGATIVE_KEYWORDS:
+        _NEG_AUTOMATON.add_word(_kw.lower(), _kw)
+    _NEG_AUTOMATON.make_automaton()
 
-def is_positive_status(status):
-    """Check if status is explicitly positive"""
-    return status in ['COMPLETED', 'COMPLETED_OK', 'HANDLED']
-
-def get_effective_status_v3(status, notes):
-    """V3 logic - get effective status considering notes"""
-    # If already negative, keep it
-    if is_negative_status(status):
-        return status
-    
-    # If positive but notes indicate issues, override to DEFECT
-    if is_positive_status(status) and has_negative_notes_v2(notes):
-        return 'DEFECT'
-    
-    return status
-
-def has_defect_v2(status, notes):
-    """V2 defect detection"""
-    return is_negative_status(status) or (is_positive_status(status) and has_negative_notes_v2(notes))
-
-def has_defect_v3(status, notes):
-    """V3 defect detection - uses effective status"""
-    effective_status = get_effective_status_v3(status, notes)
-    return is_negative_status(effective_status)
-
-def calculate_item_progress_v2(status, notes, is_first_time=False):
-    """V2 item progress calculation"""
-    has_issues = has_negative_notes_v2(notes)
-    
-    if status == 'COMPLETED_OK':
-        if has_issues:
-            return PROGRESS_THRESHOLDS['COMPLETED_WITH_ISSUES']
-        else:
-            return PROGRESS_THRESHOLDS['VERIFIED_NO_DEFECTS']
-    elif status == 'COMPLETED':
-        if has_issues:
-            return PROGRESS_THRESHOLDS['COMPLETED_WITH_ISSUES']
-        elif is_first_time:
-            return PROGRESS_THRESHOLDS['COMPLETED_OK_FIRST']
-        else:
-            return PROGRESS_THRESHOLDS['COMPLETED_OK_LATER']
-    elif status == 'HANDLED':
-        return PROGRESS_THRESHOLDS['HANDLED']
-    elif status in ['DEFECT', 'NOT_OK']:
-        return PROGRESS_THRESHOLDS['DEFECT_WORK_DONE']
-    elif status == 'IN_PROGRESS':
-        return PROGRESS_THRESHOLDS['IN_PROGRESS']
-    elif status == 'PENDING':
-        return PROGRESS_THRESHOLDS['PENDING']
-    elif status == 'NOT_STARTED':
-        return PROGRESS_THRESHOLDS['NOT_STARTED']
-    else:
-        return PROGRESS_THRESHOLDS['UNKNOWN']
-
-def calculate_item_progress_v3(status, notes, is_first_time=False):
-    """V3 item progress calculation - uses effective status"""
-    effective_status = get_effective_status_v3(status, notes)
-    
-    # Now calculate based on effective status
-    if effective_status == 'COMPLETED_OK':
-        return PROGRESS_THRESHOLDS['VERIFIED_NO_DEFECTS']
-    elif effective_status == 'COMPLETED':
-        # No negative notes by definition (would be DEFECT otherwise)
-        if is_first_time:
-            return PROGRESS_THRESHOLDS['COMPLETED_OK_FIRST']
-        else:
-            return PROGRESS_THRESHOLDS['COMPLETED_OK_LATER']
-    elif effective_status == 'HANDLED':
-        return PROGRESS_THRESHOLDS['HANDLED']
-    elif effective_status in ['DEFECT', 'NOT_OK']:
-        return PROGRESS_THRESHOLDS['DEFECT_WORK_DONE']
-    elif effective_status == 'IN_PROGRESS':
-        return PROGRESS_THRESHOLDS['IN_PROGRESS']
-    elif effective_status == 'PENDING':
-        return PROGRESS_THRESHOLDS['PENDING']
-    elif effective_status == 'NOT_STARTED':
-        return PROGRESS_THRESHOLDS['NOT_STARTED']
-    else:
-        return PROGRESS_THRESHOLDS['UNKNOWN']
-
-def calculate_apartment_progress(apt_num, version='v2'):
-    """Calculate overall progress for an apartment"""
-    print(f"\n{'='*80}")
-    print(f"Calculating {version.upper()} Progress for Apartment {apt_num}")
-    print(f"{'='*80}")
-    
+def load_latest_items(apt_num):
+    """Load the work items of an apartment's latest report (category, status, notes)"""
     # Get apartment ID first
     query_apt = """
     SELECT id FROM Apartment WHERE number = ?
     """
-    apt_df = pd.read_sql_query(query_apt, conn, params=(str(apt_num),))
+    apt_df = fast_read_sql(conn, query_apt, (str(apt_num),))
     
     if apt_df.empty:
         print(f"Apartment {apt_num} not found")
-        return None
+        return None, None
     
     apt_id = apt_df.iloc[0]['id']
     
-    # Get all work items for the latest report of this apartment
-    # Group by report and get the most recent
+    # Get the work items of the most recent report for this apartment only;
+    # the latest-date filter runs in SQL so older reports are never fetched
     query = """
-    SELECT wi.category, wi.status, wi.notes, wi.description, wi.location, 
-           r.reportDate, r.id as report_id
+    SELECT wi.category, wi.status, wi.notes, r.reportDate
     FROM WorkItem wi
     JOIN Report r ON wi.reportId = r.id
     WHERE wi.apartmentId = ?
-    ORDER BY r.reportDate DESC
+    AND r.reportDate = (
+        SELECT MAX(r2.reportDate)
+        FROM Report r2
+        JOIN WorkItem wi2 ON wi2.reportId = r2.id
+        WHERE wi2.apartmentId = ?
+    )
     """
-    all_items = pd.read_sql_query(query, conn, params=(apt_id,))
+    all_items = fast_read_sql(conn, query, (apt_id, apt_id))
     
     if all_items.empty:
         print(f"No work items found for Apartment {apt_num}")
-        return None
+        return None, None
     
-    # Get the latest report date
-    latest_date = all_items['reportDate'].max()
-    items = all_items[all_items['reportDate'] == latest_date].copy()
-    
-    print(f"\nLatest report date: {pd.to_datetime(latest_date, unit='ms').strftime('%Y-%m-%d')}")
-    print(f"Total items: {len(items)}")
+    latest_date = all_items['reportDate'].iat[0]
+    items = all_items[['category', 'status', 'notes']]
+    return items, latest_date
+
+def _score_codes(codes, neg_notes, progress_by_code, is_negative, is_positive, is_completed, with_issues):
+    """Per-item (progress_v2, progress_v3, defect) from status codes and the negative-notes flag"""
+    n = codes.shape[0]
+    progress_v2 = np.empty(n, dtype=np.int64)
+    progress_v3 = np.empty(n, dtype=np.int64)
+    defect = np.empty(n, dtype=np.bool_)
+    for i in range(n):
+        c = codes[i]
+        flagged = is_positive[c] and neg_notes[i]
+        progress_v2[i] = with_issues if (is_completed[c] and neg_notes[i]) else progress_by_code[c]
+        progress_v3[i] = progress_by_code[DEFECT_CODE] if flagged else progress_by_code[c]
+        defect[i] = is_negative[c] or flagged
+    return progress_v2, progress_v3, defect
+
+def _score_codes_numpy(codes, neg_notes, progress_by_code, is_negative, is_positive, is_completed, with_issues):
+    """Array-at-a-time equivalent of _score_codes, used when numba is not installed"""
+    flagged = is_positive[codes] & neg_notes
+    progress_v2 = np.where(is_completed[codes] & neg_notes, with_issues, progress_by_code[codes])
+    progress_v3 = np.where(flagged, progress_by_code[DEFECT_CODE], progress_by_code[codes])
+    return progress_v2, progress_v3, is_negative[codes] | flagged
+
+# With numba the fused per-item loop compiles to native code (one pass, no
+# temporaries); without it the numpy version does the same in a few C passes
+_score_kernel = njit(cache=True)(_score_codes) if njit is not None else _score_codes_numpy
+
+def score_items(items):
+    """Vectorized V2 and V3 scoring of a report's items in one pass over the columns"""
+    codes = pd.Categorical(items['status'], categories=STATUS_CATEGORIES).codes
+    # Lowercase and scan each distinct note once, then broadcast back to the rows
+    note_codes, distinct_notes = pd.factorize(items['notes'].fillna(''))
+    distinct_lower = pd.Series(distinct_notes, dtype=object).str.lower()
+    if _NEG_AUTOMATON is not None:
+        distinct_neg = np.fromiter(
+            (next(_NEG_AUTOMATON.iter(notes), None) is not None for notes in distinct_lower),
+            dtype=np.bool_, count=len(distinct_lower),
+        )
+    else:
+        distinct_neg = distinct_lower.str.contains(_NEG_RE).to_numpy(dtype=bool)
+    neg_notes = distinct_neg[note_codes]
     
-    # Calculate progress by category
-    category_progress = {}
-    category_details = defaultdict(lambda: {'items': 0, 'defects_v2': 0, 'defects_v3': 0, 'total_progress': 0})
+    # Items are always scored as repeat reports (is_first_time=False)
+    progress_v2, progress_v3, defect = _score_kernel(
+        codes, neg_notes, PROGRESS_BY_CODE,
+        IS_NEGATIVE_CODE, IS_POSITIVE_CODE, IS_COMPLETED_CODE,
+        PROGRESS_THRESHOLDS['COMPLETED_WITH_ISSUES'],
+    )
     
-    calc_func = calculate_item_progress_v2 if version == 'v2' else calculate_item_progress_v3
-    defect_func = has_defect_v2 if version == 'v2' else has_defect_v3
+    # V2 and V3 flag exactly the same items as defects
+    return pd.DataFrame({
+        'category': items['category'].to_numpy(),
+        'progress_v2': progress_v2,
+        'progress_v3': progress_v3,
+        'defect': defect,
+    })
+
+def summarize_progress(apt_num, version, latest_date, scored):
+    """Aggregate scored items per category and print the apartment's progress"""
+    print(f"\n{'='*80}")
+    print(f"Calculating {version.upper()} Progress for Apartment {apt_num}")
+    print(f"{'='*80}")
     
-    for _, item in items.iterrows():
-        cat = item['category']
-        status = item['status']
-        notes = item['notes']
-        
-        # Calculate item progress
-        item_progress = calc_func(status, notes, is_first_time=False)
-        
-        category_details[cat]['items'] += 1
-        category_details[cat]['total_progress'] += item_progress
-        
-        # Count defects
-        if version == 'v2' and has_defect_v2(status, notes):
-            category_details[cat]['defects_v2'] += 1
-        elif version == 'v3' and has_defect_v3(status, notes):
-            category_details[cat]['defects_v3'] += 1
+    print(f"\nLatest report date: {pd.to_datetime(latest_date, unit='ms').strftime('%Y-%m-%d')}")
+    print(f"Total items: {len(scored)}")
     
-    # Calculate average progress per category
-    for cat, details in category_details.items():
-        if details['items'] > 0:
-            category_progress[cat] = round(details['total_progress'] / details['items'])
+    # Per-category totals in one contiguous int64[n_categories, 3] accumulator
+    # (items, defects, total_progress), indexed by the category's code
+    cat_codes, categories = pd.factorize(scored['category'])
+    acc = np.zeros((len(categories), 3), dtype=np.int64)
+    np.add.at(acc, cat_codes, np.column_stack((
+        np.ones(len(scored), dtype=np.int64),
+        scored['defect'].to_numpy(dtype=np.int64),
+        scored[f'progress_{version}'].to_numpy(dtype=np.int64),
+    )))
     
-    # Calculate weighted overall progress
+    # Calculate progress by category and the weighted overall progress in a
+    # single pass; the weights lookup is bound to a local outside the loop
+    category_progress = {}
+    category_details = {}
+    weight_of = CATEGORY_WEIGHTS.get
     weighted_sum = 0
     total_weight = 0
     
-    for cat, progress in category_progress.items():
-        weight = CATEGORY_WEIGHTS.get(cat, 0.8)
+    for cat, (n_items, defects, total_progress) in zip(categories, acc.tolist()):
+        category_details[cat] = {
+            'items': n_items,
+            'defects_v2': defects,
+            'defects_v3': defects,
+            'total_progress': total_progress,
+        }
+        # Only categories that have items get a code, so n_items > 0
+        progress = round(total_progress / n_items)
+        category_progress[cat] = progress
+        weight = weight_of(cat, 0.8)
         weighted_sum += progress * weight
         total_weight += weight
     
@@ -239,13 +281,30 @@ def calculate_apartment_progress(apt_num, version='v2'):
     return {
         'overall': overall_progress,
         'by_category': category_progress,
-        'details': dict(category_details)
+        'details': category_details
     }
 
+def calculate_apartment_progress(apt_num, version='v2'):
+    """Calculate overall progress for an apartment"""
+    items, latest_date = load_latest_items(apt_num)
+    if items is None:
+        return None
+    return summarize_progress(apt_num, version, latest_date, score_items(items))
+
+def calculate_apartment_progress_both(apt_num):
+    """Calculate V2 and V3 progress for an apartment from a single query and scoring pass"""
+    items, latest_date = load_latest_items(apt_num)
+    if items is None:
+        return None, None
+    scored = score_items(items)
+    return (
+        summarize_progress(apt_num, 'v2', latest_date, scored),
+        summarize_progress(apt_num, 'v3', latest_date, scored),
+    )
+
 def compare_versions(apt_num):
     """Compare V2 vs V3 for an apartment"""
-    v2_result = calculate_apartment_progress(apt_num, 'v2')
-    v3_result = calculate_apartment_progress(apt_num, 'v3')
+    v2_result, v3_result = calculate_apartment_progress_both(apt_num)
     
     if v2_result and v3_result:
         print(f"\n{'='*80}")
@@ -15,11 +15,14 @@ if 'conn' in locals():
     
     try:
         df_progress = pd.read_sql_query(query, conn)
-        # Convert reportDate from timestamp (ms) to datetime
-        df_progress['reportDate'] = pd.to_datetime(df_progress['reportDate'], unit='ms')
+        # reportDate stays as the raw ms timestamp (same ordering); it is
+        # converted to datetime after aggregation in the processing step, and
+        # here only on the copy that is displayed
         
         print(f"Loaded {len(df_progress)} work items for analysis")
-        display_scrollable_dataframe(df_progress)
+        display_scrollable_dataframe(
+            df_progress.assign(reportDate=pd.to_datetime(df_progress['reportDate'], unit='ms'))
+        )
         
         # Check unique statuses to define 'Completed'
         print("Unique Data Statuses:", df_progress['status'].unique())
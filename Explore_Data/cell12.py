@@ -1,4 +1,6 @@
 # 2. Data Processing
+import numpy as np
+
 if 'df_progress' in locals():
     # Define what counts as "Complete" (Positive progress)
     # Adjust this list based on the actual statuses found above
@@ -7,12 +9,14 @@ if 'df_progress' in locals():
     # Create a binary 'is_completed' column
     # Note: 'status' in DB might be English Enum or Hebrew text. 
     # Let's assume standard ones or add logic to check containment.
-    def is_done(status):
-        if not isinstance(status, str):
-            return 0
-        return 1 if status in COMPLETED_STATUSES or 'COMPLETED' in status.upper() or 'DONE' in status.upper() else 0
-
-    df_progress['is_completed'] = df_progress['status'].apply(is_done)
+    # Vectorized over the column; missing/non-text statuses count as not done.
+    status = df_progress['status'].astype('string')
+    status_upper = status.str.upper()
+    df_progress['is_completed'] = (
+        status.isin(COMPLETED_STATUSES)
+        | status_upper.str.contains('COMPLETED', regex=False, na=False)
+        | status_upper.str.contains('DONE', regex=False, na=False)
+    ).astype('int8')
     
     # Group by Apartment, Category, Date
     # We want Cumulative Sum over time.
@@ -20,10 +24,21 @@ if 'df_progress' in locals():
     # First, pivot or group to get counts per day
     df_grouped = df_progress.groupby(['apartment_number', 'category', 'reportDate'])['is_completed'].sum().reset_index()
     
+    # Convert reportDate from timestamp (ms) to datetime on the aggregated rows only
+    df_grouped['reportDate'] = pd.to_datetime(df_grouped['reportDate'], unit='ms')
+    
     # Sort properly
     df_grouped.sort_values(['apartment_number', 'category', 'reportDate'], inplace=True)
     
     # Calculate Cumulative Sum per Group
-    df_grouped['cumulative_completed'] = df_grouped.groupby(['apartment_number', 'category'])['is_completed'].transform(pd.Series.cumsum)
+    # Rows are sorted by group, so one running total over the whole column minus
+    # the total reached before each group's first row gives the per-group cumsum
+    completed = df_grouped['is_completed'].to_numpy()
+    group_key = (df_grouped['apartment_number'].astype(str) + '|' + df_grouped['category'].astype(str)).to_numpy()
+    group_start = np.ones(len(group_key), dtype=bool)
+    group_start[1:] = group_key[1:] != group_key[:-1]
+    running = np.cumsum(completed)
+    offsets = np.maximum.accumulate(np.where(group_start, running - completed, 0))
+    df_grouped['cumulative_completed'] = running - offsets
     
     display_scrollable_dataframe(df_grouped)
\ No newline at end of file
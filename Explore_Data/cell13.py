@@ -1,44 +1,39 @@
 # Visualization
 import matplotlib.pyplot as plt
-import seaborn as sns
 
 # Using the 'df_grouped' from previous step
 if 'df_grouped' in locals() and not df_grouped.empty:
+    # Pivot once: one column per (apartment, category) series, indexed by date
+    trajectories = df_grouped.pivot(
+        index='reportDate',
+        columns=['apartment_number', 'category'],
+        values='cumulative_completed'
+    )
     apartments = sorted(df_grouped['apartment_number'].unique())
-    
-    # Define category order for consistency (optional)
-    categories = sorted(df_grouped['category'].unique())
-    
+
     # Create a separate plot for each apartment
     for apt_num in apartments:
-        apt_data = df_grouped[df_grouped['apartment_number'] == apt_num]
-        
-        plt.figure(figsize=(12, 6))
-        ax = plt.gca()
-        
-        # Plot each category line
-        sns.lineplot(
-            data=apt_data, 
-            x='reportDate', 
-            y='cumulative_completed', 
-            hue='category',
-            style='category',
-            markers=True, 
-            dashes=False,
-            ax=ax
-        )
-        
+        apt_data = trajectories[apt_num]
+
+        fig, ax = plt.subplots(figsize=(12, 6))
+
+        # Plot each category line (only the dates that category was reported on)
+        for category in sorted(apt_data.columns):
+            points = apt_data[category].dropna()
+            ax.plot(points.index, points.values, marker='o', label=category)
+
         ax.set_title(f'Apartment {apt_num} - Completion Trajectory')
         ax.set_xlabel('Date')
         ax.set_ylabel('Items Completed (Cumulative)')
-        plt.xticks(rotation=45)
+        ax.tick_params(axis='x', labelrotation=45)
         ax.grid(True, linestyle='--', alpha=0.7)
-        
+
         # Move legend to outside if crowded
-        plt.legend(bbox_to_anchor=(1.05, 1), loc='upper left')
-        
-        plt.tight_layout()
+        ax.legend(bbox_to_anchor=(1.05, 1), loc='upper left')
+
+        fig.tight_layout()
         plt.show()
-        
+        plt.close(fig)
+
 else:
     print("No data available for visualization")
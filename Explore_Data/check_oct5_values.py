@@ -1,9 +1,6 @@
-import sqlite3
 import pandas as pd
 
-# Connect to DB
-db_path = r'c:\Users\yoel\constructor\prisma\dev.db'
-conn = sqlite3.connect(db_path)
+from db_utils import query, read_transaction
 
 # 1. Get all reports for Apt 7 in late 2025 to see dates
 query_dates = """
@@ -17,11 +14,6 @@ query_dates = """
     ORDER BY r.reportDate
 """
 
-df_dates = pd.read_sql_query(query_dates, conn)
-df_dates['reportDate_dt'] = pd.to_datetime(df_dates['reportDate'], unit='ms')
-print("--- Report Dates for Apt 7 (Sept-Dec 2025) ---")
-print(df_dates)
-
 # 2. Check closest report to Oct 5 (2025-10-05)
 # If user says "October 5 report", maybe there is one. 
 # Or maybe they mean the status *on* Oct 5 (which would be the status from the previous report, or the next one if that's how they think).
@@ -45,8 +37,14 @@ query_data = """
     ORDER BY r.reportDate
 """
 
-df = pd.read_sql_query(query_data, conn)
-df['reportDate_dt'] = pd.to_datetime(df['reportDate'], unit='ms')
+# Both reads share one transaction: one lock acquisition, one consistent snapshot
+with read_transaction():
+    df_dates = query(query_dates)
+    df = query(query_data)
+
+df_dates['reportDate_dt'] = pd.to_datetime(df_dates['reportDate'], unit='ms')
+print("--- Report Dates for Apt 7 (Sept-Dec 2025) ---")
+print(df_dates)
 
 # Status Map
 STATUS_MAP = {
@@ -62,10 +60,9 @@ df['state'] = df['status'].map(STATUS_MAP).fillna('INFO')
 # Identify defects
 defects_only = df[df['state'] == 'DEFECT'].copy()
 
-# Count per report
-counts = defects_only.groupby(['reportDate_dt', 'category']).size().reset_index(name='pending_defects')
+# Count per report (group on the raw ms timestamp; only the counts get converted)
+counts = defects_only.groupby(['reportDate', 'category']).size().reset_index(name='pending_defects')
+counts.insert(0, 'reportDate_dt', pd.to_datetime(counts.pop('reportDate'), unit='ms'))
 
 print("\n--- Defect Counts per Report (Chart Values) ---")
 print(counts.to_string())
-
-conn.close()
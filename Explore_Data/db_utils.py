@@ -0,0 +1,80 @@
+"""
+Shared SQLite access for the Explore_Data debug scripts.
+
+One cached connection per process, tuned once, so scripts (and notebook
+cells importing them) don't reconnect and re-apply settings on every run.
+"""
+
+import sqlite3
+from contextlib import contextmanager
+from functools import lru_cache
+
+import pandas as pd
+
+# Hardcoded for reliability in this specific environment content
+DB_PATH = r'c:\Users\yoel\constructor\prisma\dev.db'
+
+
+@lru_cache(maxsize=1)
+def get_conn():
+    """Return the shared connection, opening and tuning it on first use"""
+    conn = sqlite3.connect(DB_PATH, check_same_thread=False, cached_statements=256)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA cache_size=-65536")  # 64 MB page cache
+    conn.execute("PRAGMA mmap_size=268435456")  # 256 MB memory map
+    # The debug scripts only read; this also lets SQLite skip write-journal setup
+    conn.execute("PRAGMA query_only=ON")
+    return conn
+
+
+@contextmanager
+def read_transaction():
+    """
+    Run several reads inside one deferred transaction.
+
+    SQLite takes the shared lock once for the whole block instead of once per
+    statement, and every query sees the same snapshot of the DB.
+    """
+    conn = get_conn()
+    if conn.in_transaction:
+        yield conn
+        return
+    conn.execute("BEGIN DEFERRED")
+    try:
+        yield conn
+    finally:
+        conn.execute("COMMIT")
+
+
+def fast_read_sql(conn, sql, params=()):
+    """
+    Drop-in for pd.read_sql_query on a plain sqlite3 connection.
+
+    Fetches the rows straight from the cursor and builds the DataFrame in one
+    go, skipping pandas' generic SQL reader machinery.
+    """
+    cur = conn.execute(sql, params)
+    columns = [c[0] for c in cur.description]
+    return pd.DataFrame.from_records(cur.fetchall(), columns=columns)
+
+
+def iter_read_sql(conn, sql, params=(), chunksize=10_000):
+    """
+    Like fast_read_sql, but yield the result as DataFrames of at most
+    ``chunksize`` rows, fetched lazily from the cursor.
+
+    Always yields at least one (possibly empty) frame, so callers can
+    pd.concat the results without special-casing an empty query.
+    """
+    cur = conn.execute(sql, params)
+    columns = [c[0] for c in cur.description]
+    while True:
+        rows = cur.fetchmany(chunksize)
+        yield pd.DataFrame.from_records(rows, columns=columns)
+        if len(rows) < chunksize:
+            return
+
+
+def query(sql, params=()):
+    """Run a SELECT on the shared connection and return the rows as a DataFrame"""
+    return fast_read_sql(get_conn(), sql, params)
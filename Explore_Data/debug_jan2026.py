@@ -1,18 +1,16 @@
-import sqlite3
-import pandas as pd
 import sys
 
+import pandas as pd
+
+from db_utils import query
+
 # Force UTF-8 encoding for stdout
 sys.stdout.reconfigure(encoding='utf-8')
 
-# Connect to DB
-db_path = r'c:\Users\yoel\constructor\prisma\dev.db'
-conn = sqlite3.connect(db_path)
-
 print("--- WorkItems for Apt 7 in Jan 2026 ---")
 # Query for reports in Jan 2026
 # Jan 1 2026 is approx 1767225600000
-query = """
+sql = """
     SELECT 
         r.reportDate,
         wi.id,
@@ -29,7 +27,7 @@ query = """
     ORDER BY r.reportDate, wi.category
 """
 
-df = pd.read_sql_query(query, conn)
+df = query(sql)
 df['reportDate_dt'] = pd.to_datetime(df['reportDate'], unit='ms')
 
 if not df.empty:
@@ -40,5 +38,3 @@ if not df.empty:
         print(f"Notes: {row['notes']}")
 else:
     print("No items found for Jan 2026.")
-
-conn.close()
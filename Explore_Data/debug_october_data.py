@@ -1,11 +1,8 @@
-import sqlite3
 import pandas as pd
 
-# Connect to DB
-db_path = r'c:\Users\yoel\constructor\prisma\dev.db'
-conn = sqlite3.connect(db_path)
+from db_utils import query
 
-query = """
+sql = """
     SELECT 
         r.reportDate,
         a.number as apartment_number,
@@ -17,17 +14,17 @@ query = """
     JOIN Report r ON wi.reportId = r.id
     JOIN Apartment a ON wi.apartmentId = a.id
     WHERE a.number = '7'
+    AND r.reportDate BETWEEN ? AND ?
     ORDER BY r.reportDate ASC
 """
 
-df = pd.read_sql_query(query, conn)
-df['reportDate_dt'] = pd.to_datetime(df['reportDate'], unit='ms')
-
 # Filter for reports in Late 2025 (Sept, Oct, Nov)
+# The range is applied in SQL on the ms-epoch column, so only these rows are read
 start_date = '2025-09-01'
 end_date = '2025-11-30'
-mask = (df['reportDate_dt'] >= start_date) & (df['reportDate_dt'] <= end_date)
-df_oct = df.loc[mask]
+start_ms = pd.Timestamp(start_date).value // 10**6
+end_ms = pd.Timestamp(end_date).value // 10**6
+df_oct = query(sql, (start_ms, end_ms))
 
 print(f"--- Unique Descriptions Analysis for Apt 7 ({start_date} to {end_date}) ---")
 
@@ -43,7 +40,8 @@ if not df_oct.empty:
         # Show details for one example
         example_cat, example_loc = multi_desc.index[0]
         print(f"\nExample Details for Category='{example_cat}', Location='{example_loc}':")
-        details = df_oct[(df_oct['category'] == example_cat) & (df_oct['location'] == example_loc)]
+        details = df_oct[(df_oct['category'] == example_cat) & (df_oct['location'] == example_loc)].copy()
+        details['reportDate_dt'] = pd.to_datetime(details['reportDate'], unit='ms')
         print(details[['reportDate_dt', 'status', 'description']].to_string())
     else:
         print("\nNo (Category, Location) pairs have multiple unique descriptions in this period.")
@@ -53,5 +51,3 @@ if not df_oct.empty:
     # Assuming Description + Location + Category defines a unique defect
     unique_defects = df_oct.groupby(['category', 'location', 'description']).size().reset_index(name='count')
     print(unique_defects.groupby('category').size())
-
-conn.close()
@@ -1,13 +1,7 @@
-import sqlite3
-import pandas as pd
-import sys
-
-# Connect to DB
-db_path = r'c:\Users\yoel\constructor\prisma\dev.db'
-conn = sqlite3.connect(db_path)
+from db_utils import query
 
 # Query specifically for records on Sept 17 2025
-query = """
+sql = """
     SELECT 
         wi.id,
         wi.category,
@@ -23,7 +17,7 @@ query = """
     AND r.reportDate = 1758067200000
 """
 
-df = pd.read_sql_query(query, conn)
+df = query(sql)
 
 print(f"--- WorkItems for Apt 7 on Sept 17, 2025 (Total: {len(df)}) ---")
 if not df.empty:
@@ -37,5 +31,3 @@ if not df.empty:
         print(f"  Description (repr): {repr(desc)}")
 else:
     print("No items found for this date.")
-
-conn.close()
@@ -1,13 +1,7 @@
-import sqlite3
-import pandas as pd
-import sys
-
-# Connect to DB
-db_path = r'c:\Users\yoel\constructor\prisma\dev.db'
-conn = sqlite3.connect(db_path)
+from db_utils import query
 
 # Query specifically for records on Sept 17 2025 (1758067200000)
-query = """
+sql = """
     SELECT 
         wi.id,
         wi.category,
@@ -23,7 +17,7 @@ query = """
     AND r.reportDate = 1758067200000
 """
 
-df = pd.read_sql_query(query, conn)
+df = query(sql)
 
 with open('debug_sept17_result.txt', 'w', encoding='utf-8') as f:
     f.write(f"--- WorkItems for Apt 7 on Sept 17, 2025 (Total: {len(df)}) ---\n")
@@ -38,5 +32,3 @@ with open('debug_sept17_result.txt', 'w', encoding='utf-8') as f:
             f.write(f"  Has Photo: {row['hasPhoto']}\n")
     else:
         f.write("No items found for this date.\n")
-
-conn.close()
@@ -10,12 +10,9 @@ except ImportError:
 import matplotlib
 matplotlib.use('Agg')  # Non-interactive backend
 import matplotlib.pyplot as plt
-import seaborn as sns
-import numpy as np
 import sqlite3
 import pandas as pd
 import os
-from datetime import datetime
 
 # Connect to DB
 db_path = r'c:\Users\yoel\constructor\prisma\dev.db'
@@ -1,16 +1,257 @@
 from __future__ import annotations
 
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Any, Optional
-import math
+import hashlib
+import html
+import json
 import uuid
 
 import pandas as pd
-from IPython.display import HTML, display, clear_output, display_html
+from IPython.display import display, clear_output, display_html
 import ipywidgets as widgets  # type: ignore
 
 
 DEFAULT_ROW_HEIGHT_PX = 28
 DEFAULT_HEADER_HEIGHT_PX = 36
+# Views with more rows than this are rendered by a JS virtualiser instead of
+# one static <tr> per row
+VIRTUAL_SCROLL_MIN_ROWS = 500
+VIRTUAL_SCROLL_OVERSCAN = 10
+# Number of rendered <table> fragments kept for re-displays of the same data
+HTML_CACHE_SIZE = 64
+
+# Frozen column width estimate: longest rendered value * char width + padding
+FROZEN_CHAR_PX = 8
+FROZEN_CELL_PADDING_PX = 24
+FROZEN_MAX_WIDTH_PX = 320
+
+DEFAULT_THEME = {
+    "outer_border": "#d0d7de",
+    "header_background": "#f6f8fa",
+    "header_color": "#0b1526",
+    "row_border": "#eaeef2",
+    "row_background": "#ffffff",
+    "row_alt_background": "#f9fbfd",
+    "font_family": (
+        "-apple-system, BlinkMacSystemFont, 'Segoe UI', "
+        "system-ui, sans-serif"
+    ),
+    "font_size": "13px",
+}
+
+# Everything that depends only on the theme; formatted once per theme and
+# scoped by a theme class. Rows carry their background in --sdf-row-bg so
+# sticky cells pick up the zebra striping without per-column rules.
+_BASE_CSS_TEMPLATE = """
+      .{scope} {{
+        border: 1px solid {outer_border};
+        border-radius: 6px;
+        overflow-x: auto;
+        overflow-y: auto;
+        box-sizing: border-box;
+        background: {row_background};
+        box-shadow: 0 1px 2px rgba(15, 23, 42, 0.08);
+      }}
+
+      .{scope} .scrollable-dataframe-table {{
+        border-collapse: collapse;
+        width: max-content;
+        min-width: 100%;
+        font-family: {font_family};
+        font-size: {font_size};
+        color: {header_color};
+      }}
+
+      .{scope} .scrollable-dataframe-table thead {{
+        background: {header_background};
+        z-index: 1;
+      }}
+
+      .{scope} .scrollable-dataframe-table thead th {{
+        position: sticky;
+        top: 0;
+        padding: 8px 12px;
+        border-bottom: 1px solid {outer_border};
+        background: {header_background};
+        text-align: left !important;
+        direction: ltr !important;
+        z-index: 1; 
+      }}
+
+      .{scope} .scrollable-dataframe-table tbody tr {{
+        height: {row_height}px;
+        --sdf-row-bg: {row_background};
+      }}
+
+      .{scope} .scrollable-dataframe-table tbody tr:nth-child(even) {{
+        --sdf-row-bg: {row_alt_background};
+      }}
+
+      .{scope} .scrollable-dataframe-table tbody td {{
+        padding: 6px 12px;
+        border-bottom: 1px solid {row_border};
+        background: var(--sdf-row-bg);
+        text-align: left !important;
+        direction: ltr !important;
+      }}
+
+      .{scope} .scrollable-dataframe-table tbody tr:hover td {{
+        background: rgba(148, 163, 184, 0.14);
+      }}
+
+      .{scope} .scrollable-dataframe-table caption {{
+        caption-side: bottom;
+        padding: 8px 12px;
+        text-align: left;
+        color: rgba(15, 23, 42, 0.6);
+      }}
+"""
+
+
+@lru_cache(maxsize=16)
+def _themed_css(theme_items: tuple) -> tuple[str, str]:
+    """
+    Return ``(scope_class, css)`` for a resolved theme given as sorted
+    ``(key, value)`` pairs. Equal themes share the class and the CSS text.
+    """
+    digest = hashlib.blake2b(repr(theme_items).encode(), digest_size=6).hexdigest()
+    scope = f"sdf-theme-{digest}"
+    css = _BASE_CSS_TEMPLATE.format(scope=scope, row_height=DEFAULT_ROW_HEIGHT_PX, **dict(theme_items))
+    return scope, css
+
+
+# Placeholder for the per-render table id inside cached fragments
+_TABLE_ID_TOKEN = "__scrollable_table_id__"
+_html_cache: OrderedDict[tuple, str] = OrderedDict()
+
+
+def _frame_key(df: pd.DataFrame) -> Optional[tuple]:
+    """
+    Content key for ``df``: a digest of its values and index plus everything
+    else the HTML depends on (labels, axis names, dtypes and the display
+    precision). Returns None when the frame holds unhashable values.
+    """
+    try:
+        hashes = pd.util.hash_pandas_object(df, index=True).to_numpy()
+    except TypeError:
+        return None
+    digest = hashlib.blake2b(hashes.tobytes(), digest_size=16).digest()
+    return (
+        digest,
+        df.shape,
+        tuple(map(str, df.columns)),
+        tuple(map(str, df.dtypes)),
+        tuple(map(str, df.index.names)),
+        tuple(map(str, df.columns.names)),
+        pd.get_option("display.precision"),
+    )
+
+
+def _format_cell(value: Any, precision: int) -> str:
+    """Plain cell text for one value; missing values of any kind are empty"""
+    if pd.api.types.is_scalar(value) and pd.isna(value):
+        return ""
+    if isinstance(value, float):
+        value = round(value, precision)
+    return str(value)
+
+
+def _format_column(values: pd.Series | pd.Index, precision: int) -> list[str]:
+    """
+    Plain cell text for one column or index level.
+
+    Datetime-like columns go through pandas' own column formatting, as in
+    ``to_html``: the time is dropped when every value falls on midnight.
+    """
+    if values.dtype.kind in "mM":
+        values = pd.Series(values, copy=False)
+        return values.astype(str).where(values.notna(), "").tolist()
+    return [_format_cell(value, precision) for value in values]
+
+
+def _format_columns(df: pd.DataFrame) -> list[list[str]]:
+    """Cell text of every index level, then every data column"""
+    precision = pd.get_option("display.precision")
+    levels = [df.index.get_level_values(i) for i in range(df.index.nlevels)]
+    columns = [df.iloc[:, j] for j in range(df.shape[1])]
+    return [_format_column(values, precision) for values in levels + columns]
+
+
+def _fast_to_html(df: pd.DataFrame, table_class: str) -> str:
+    """
+    Build the table HTML directly for flat (single-level index and columns)
+    frames, bypassing pandas' HTMLFormatter and its per-cell overhead.
+
+    Produces the same structure as ``to_html``; missing values (None, NaN,
+    NaT, NA) render as empty cells, and floats are rounded to
+    ``display.precision``.
+    """
+    escape = html.escape
+    header = "".join(f"<th>{escape(str(c))}</th>" for c in df.columns)
+    # to_html puts the columns' name in the top-left corner cell
+    corner = escape(str(df.columns.name)) if df.columns.name is not None else ""
+    head = f'<thead><tr style="text-align: right;"><th>{corner}</th>{header}</tr>'
+    if df.index.name is not None:
+        blanks = "<th></th>" * df.shape[1]
+        head += f"<tr><th>{escape(str(df.index.name))}</th>{blanks}</tr>"
+    head += "</thead>"
+
+    body = "".join(
+        f"<tr><th>{escape(idx)}</th>"
+        + "".join(f"<td>{escape(v)}</td>" for v in row)
+        + "</tr>"
+        for idx, *row in zip(*_format_columns(df))
+    )
+    return f'<table class="dataframe {table_class}">{head}<tbody>{body}</tbody></table>'
+
+
+def _cached_to_html(df: pd.DataFrame) -> str:
+    """
+    Table HTML for the scrollable view, memoised by frame content.
+
+    Re-displaying the same data (re-running a cell, changing ``visible_rows``
+    or ``freeze_cols``) skips the HTML serialisation. The fragment carries
+    ``_TABLE_ID_TOKEN`` in place of the table id, which callers substitute.
+    """
+    key = _frame_key(df)
+    if key is not None and key in _html_cache:
+        _html_cache.move_to_end(key)
+        return _html_cache[key]
+
+    table_class = f"scrollable-dataframe-table {_TABLE_ID_TOKEN}"
+    if df.index.nlevels == 1 and df.columns.nlevels == 1:
+        html_table = _fast_to_html(df, table_class)
+    else:
+        # notebook=False ensures we get a raw HTML table without pandas environment overrides
+        html_table = df.to_html(classes=table_class, border=0, notebook=False)
+    if key is not None:
+        _html_cache[key] = html_table
+        if len(_html_cache) > HTML_CACHE_SIZE:
+            _html_cache.popitem(last=False)
+    return html_table
+
+
+def _estimate_frozen_widths(df: pd.DataFrame, n_frozen: int) -> list[int]:
+    """
+    Estimate pixel widths of the first ``n_frozen`` table columns (index
+    levels first, then data columns) from the longest label or value.
+    """
+    n_index_levels = df.index.nlevels
+    widths = []
+    for i in range(min(n_frozen, n_index_levels + df.shape[1])):
+        if i < n_index_levels:
+            label = df.index.names[i]
+            values = pd.Series(df.index.get_level_values(i))
+        else:
+            label = df.columns[i - n_index_levels]
+            values = df.iloc[:, i - n_index_levels]
+        longest = len(str(label)) if label is not None else 0
+        if len(values):
+            longest = max(longest, int(values.astype(str).str.len().max()))
+        widths.append(min(longest * FROZEN_CHAR_PX + FROZEN_CELL_PADDING_PX, FROZEN_MAX_WIDTH_PX))
+    return widths
 
 
 def _render_scrollable_html(
@@ -19,24 +260,21 @@ def _render_scrollable_html(
     max_width: str,
     theme: dict[str, Any],
     freeze_cols: int,
+    start: int = 0,
+    total: Optional[int] = None,
 ) -> str:
     """
     Internal helper to generate the HTML string for a single dataframe view (page).
+
+    When ``total`` is given, ``df`` is treated as the page starting at row
+    ``start`` of a larger frame and a "Rows x-y of total" caption is added.
+    Views longer than ``VIRTUAL_SCROLL_MIN_ROWS`` ship their rows as JSON and
+    only the rows around the viewport are materialised as ``<tr>`` elements.
     """
-    resolved_theme = {
-        "outer_border": "#d0d7de",
-        "header_background": "#f6f8fa",
-        "header_color": "#0b1526",
-        "row_border": "#eaeef2",
-        "row_background": "#ffffff",
-        "row_alt_background": "#f9fbfd",
-        "font_family": (
-            "-apple-system, BlinkMacSystemFont, 'Segoe UI', "
-            "system-ui, sans-serif"
-        ),
-        "font_size": "13px",
-        **(theme or {}),
-    }
+    resolved_theme = {**DEFAULT_THEME, **(theme or {})}
+    scope, base_css = _themed_css(tuple(sorted(
+        (key, value) for key, value in resolved_theme.items() if key != "freeze_widths"
+    )))
 
     max_height = DEFAULT_HEADER_HEIGHT_PX + visible_rows * DEFAULT_ROW_HEIGHT_PX
     # Create unique ID for both table and container to strict scope CSS
@@ -44,162 +282,145 @@ def _render_scrollable_html(
     table_id = f"scrollable_table_{unique_id}"
     container_id = f"scrollable_container_{unique_id}"
     
-    # notebook=False ensures we get a raw HTML table without pandas environment overrides
-    html_table = df.to_html(
-        classes=f"scrollable-dataframe-table {table_id}", 
-        border=0, 
-        notebook=False
+    # Large views keep only the rows near the viewport in the DOM; the rest
+    # stay in an embedded JSON array and are rendered on scroll
+    virtualize = len(df) > VIRTUAL_SCROLL_MIN_ROWS
+
+    html_table = _cached_to_html(df.iloc[:0] if virtualize else df).replace(
+        _TABLE_ID_TOKEN, table_id
     )
+    if total is not None:
+        end = start + len(df)
+        caption = f"<caption>Rows {start + 1 if end else 0}-{end} of {total}</caption>"
+        # Insert right after the opening <table ...> tag
+        tag_end = html_table.index(">") + 1
+        html_table = html_table[:tag_end] + caption + html_table[tag_end:]
 
     n_index_levels = df.index.nlevels
     total_frozen = n_index_levels + freeze_cols
-    
-    js_script = ""
-    if total_frozen > 0:
-        js_script = f"""
+
+    virtual_script = ""
+    if virtualize:
+        # Index levels first, then the values, one JSON array per row; the
+        # text comes from the same formatter as the static table
+        rows = list(zip(*_format_columns(df)))
+        # Escape "<" so the data can't close the script tag
+        data_json = json.dumps(rows, ensure_ascii=False).replace("<", "\\u003c")
+        virtual_script = f"""
+        <script type="application/json" id="{container_id}_data">{data_json}</script>
         <script>
         (function() {{
-            const tableId = '{table_id}';
-            
-            function run() {{
-                const table = document.getElementsByClassName(tableId)[0];
-                if (!table) return;
-
-                function applyStickyCSS() {{
-                    const firstBodyRow = table.querySelector('tbody tr');
-                    if (!firstBodyRow) return;
-                    
-                    const cells = firstBodyRow.children;
-                    if (!cells.length) return;
-
-                    let currentLeft = 0;
-                    let cssRules = [];
-                    
-                    const totalFrozen = {total_frozen};
-                    const limit = Math.min(totalFrozen, cells.length);
-
-                    for (let i = 0; i < limit; i++) {{
-                        const cell = cells[i];
-                        const width = cell.offsetWidth;
-                        const nth = i + 1;
-                        
-                        // TH Rule (Header)
-                        cssRules.push(`
-                            .{table_id} thead tr > *:nth-child(${{nth}}) {{
-                                position: sticky;
-                                left: ${{currentLeft}}px;
-                                z-index: 5 !important;
-                            }}
-                        `);
-
-                        // TD Rule (Body)
-                        cssRules.push(`
-                            .{table_id} tbody tr > *:nth-child(${{nth}}) {{
-                                position: sticky;
-                                left: ${{currentLeft}}px;
-                                z-index: 3;
-                                background: {resolved_theme["row_background"]};
-                            }}
-                        `);
-                        
-                        // Alternating row background fix for sticky columns
-                        cssRules.push(`
-                            .{table_id} tbody tr:nth-child(even) > *:nth-child(${{nth}}) {{
-                                background: {resolved_theme["row_alt_background"]};
-                            }}
-                        `);
-                        
-                        currentLeft += width;
-                    }}
-                    
-                    const style = document.createElement('style');
-                    style.innerHTML = cssRules.join('\\n');
-                    document.head.appendChild(style);
+            const container = document.getElementById('{container_id}');
+            const dataTag = document.getElementById('{container_id}_data');
+            if (!container || !dataTag) return;
+            const tbody = container.querySelector('tbody');
+            if (!tbody) return;
+
+            const data = JSON.parse(dataTag.textContent);
+            const ROW_H = {DEFAULT_ROW_HEIGHT_PX};
+            const OVERSCAN = {VIRTUAL_SCROLL_OVERSCAN};
+            const windowSize = {visible_rows} + 2 * OVERSCAN;
+            const nIndex = {n_index_levels};
+            const escapes = {{'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;'}};
+
+            function cellHtml(value, j) {{
+                const text = value.replace(/[&<>"]/g, c => escapes[c]);
+                return j < nIndex ? `<th>${{text}}</th>` : `<td>${{text}}</td>`;
+            }}
+
+            // Spacer rows above and below keep the scrollbar geometry of the
+            // full table. They sit in their own <tbody> elements so they don't
+            // count towards the nth-child zebra striping of the data rows.
+            function spacerBody() {{
+                const body = document.createElement('tbody');
+                body.className = 'sdf-spacer';
+                body.appendChild(document.createElement('tr'));
+                return body;
+            }}
+            const topSpacer = spacerBody();
+            const bottomSpacer = spacerBody();
+            tbody.before(topSpacer);
+            tbody.after(bottomSpacer);
+
+            let lastStart = -1;
+            function render() {{
+                let start = Math.max(0, Math.floor(container.scrollTop / ROW_H) - OVERSCAN);
+                start -= start % 2;  // keep the zebra striping stable while scrolling
+                if (start === lastStart) return;
+                lastStart = start;
+                const end = Math.min(data.length, start + windowSize);
+
+                const parts = [];
+                for (let i = start; i < end; i++) {{
+                    parts.push('<tr>' + data[i].map(cellHtml).join('') + '</tr>');
                 }}
+                topSpacer.firstChild.style.height = `${{start * ROW_H}}px`;
+                bottomSpacer.firstChild.style.height = `${{(data.length - end) * ROW_H}}px`;
+                tbody.innerHTML = parts.join('');
+            }}
 
+            let pending = false;
+            container.addEventListener('scroll', () => {{
+                if (pending) return;
+                pending = true;
                 requestAnimationFrame(() => {{
-                   setTimeout(applyStickyCSS, 50);
+                    pending = false;
+                    render();
                 }});
-            }}
-            
-            if (document.readyState === 'loading') {{
-                document.addEventListener('DOMContentLoaded', run);
-            }} else {{
-                run();
-            }}
+            }});
+            render();
         }})();
         </script>
         """
-
-    # We scope CSS to the specific container ID to avoid global collisions
-    html = f"""
-    <style>
-      #{container_id} {{
-        border: 1px solid {resolved_theme["outer_border"]};
-        border-radius: 6px;
-        overflow-x: auto;
-        overflow-y: auto;
-        max-width: {max_width};
-        max-height: {max_height}px;
+    
+    # Sticky offsets are computed here from estimated widths rather than
+    # measured in the browser; the frozen cells are pinned to those widths.
+    # Pass theme={"freeze_widths": [...]} (pixels, index levels first) to
+    # override the estimates.
+    sticky_css = ""
+    if total_frozen > 0:
+        overrides = list(resolved_theme.get("freeze_widths", ()))
+        widths = overrides + _estimate_frozen_widths(df, total_frozen)[len(overrides):]
+        # Shared by every frozen column; only offsets and widths differ per column
+        rules = [f"""
+      .{table_id} tr > *:nth-child(-n+{total_frozen}) {{
         box-sizing: border-box;
-        background: {resolved_theme["row_background"]};
-        box-shadow: 0 1px 2px rgba(15, 23, 42, 0.08);
+        overflow-wrap: anywhere;
       }}
 
-      #{container_id} .scrollable-dataframe-table {{
-        border-collapse: collapse;
-        width: max-content;
-        min-width: 100%;
-        font-family: {resolved_theme["font_family"]};
-        font-size: {resolved_theme["font_size"]};
-        color: {resolved_theme["header_color"]};
-      }}
-
-      #{container_id} .scrollable-dataframe-table thead {{
-        background: {resolved_theme["header_background"]};
-        z-index: 1;
-      }}
-
-      #{container_id} .scrollable-dataframe-table thead th {{
+      .{table_id} thead tr > *:nth-child(-n+{total_frozen}) {{
         position: sticky;
-        top: 0;
-        padding: 8px 12px;
-        border-bottom: 1px solid {resolved_theme["outer_border"]};
-        background: {resolved_theme["header_background"]};
-        text-align: left !important;
-        direction: ltr !important;
-        z-index: 1; 
+        z-index: 5 !important;
       }}
 
-      #{container_id} .scrollable-dataframe-table tbody td {{
-        padding: 6px 12px;
-        border-bottom: 1px solid {resolved_theme["row_border"]};
-        background: {resolved_theme["row_background"]};
-        text-align: left !important;
-        direction: ltr !important;
-      }}
-
-      #{container_id} .scrollable-dataframe-table tbody tr:nth-child(even) td {{
-        background: {resolved_theme["row_alt_background"]};
-      }}
-
-      #{container_id} .scrollable-dataframe-table tbody tr:hover td {{
-        background: rgba(148, 163, 184, 0.14);
+      .{table_id} tbody tr > *:nth-child(-n+{total_frozen}) {{
+        position: sticky;
+        z-index: 3;
+        background: var(--sdf-row-bg);
       }}
+"""]
+        left = 0
+        for nth, width in enumerate(widths[:total_frozen], start=1):
+            rules.append(
+                f"      .{table_id} tr > *:nth-child({nth}) "
+                f"{{ left: {left}px; width: {width}px; min-width: {width}px; max-width: {width}px; }}\n"
+            )
+            left += width
+        sticky_css = "".join(rules)
 
-      #{container_id} .scrollable-dataframe-table caption {{
-        caption-side: bottom;
-        padding: 8px 12px;
-        text-align: left;
-        color: rgba(15, 23, 42, 0.6);
-      }}
+    # Theme CSS is scoped by the theme class, sticky rules by the table id
+    markup = f"""
+    <style>
+      {base_css}
+      {sticky_css}
     </style>
-    <div id="{container_id}" class="scrollable-dataframe-container">
+    <div id="{container_id}" class="scrollable-dataframe-container {scope}"
+         style="max-width: {max_width}; max-height: {max_height}px;">
       {html_table}
     </div>
-    {js_script}
+    {virtual_script}
     """
-    return html
+    return markup
 
 
 def display_scrollable_dataframe(
@@ -214,32 +435,78 @@ def display_scrollable_dataframe(
     """
     Render a pandas DataFrame inside a scrollable container for Jupyter notebooks.
     
-    This version renders the entire DataFrame as a scrollable HTML block, avoiding
-    ipywidgets dependencies which can fail to render in some VS Code environments.
+    Frames that fit in a single page render as one static HTML block, with no
+    ipywidgets involved (they can fail to render in some VS Code environments).
+    Larger frames are paginated: only the current page of ``page_size`` rows is
+    serialised to HTML, with Prev/Next buttons to move between pages.
 
     Args:
         df: The DataFrame to render.
         visible_rows: Approximate number of rows to keep visible without scrolling.
         max_width: CSS width limit for the outer container. Defaults to "100%".
         theme: Optional mapping of CSS variables to override default styling.
+            ``freeze_widths`` (a list of pixel widths, index levels first)
+            overrides the estimated widths of the frozen columns.
         freeze_cols: Number of columns to freeze from the left (excluding index).
-        page_size: Ignored in this static version (kept for API compatibility).
+        page_size: Number of rows rendered per page.
     """
     if not isinstance(df, pd.DataFrame):
         raise TypeError("display_scrollable_dataframe expects a pandas DataFrame.")
 
     if visible_rows <= 0:
         raise ValueError("visible_rows must be a positive integer.")
-        
-    # Generate HTML for the full dataframe
-    # The container CSS (max-height) handles the scrolling for large tables
-    html = _render_scrollable_html(
-        df, 
-        visible_rows=visible_rows,
-        max_width=max_width,
-        theme=theme,
-        freeze_cols=freeze_cols
-    )
-    
-    # Use display_html to render raw HTML content
-    display_html(html, raw=True)
+
+    if page_size <= 0:
+        raise ValueError("page_size must be a positive integer.")
+
+    total = len(df)
+    if total <= page_size:
+        # Single page: the container CSS (max-height) handles the scrolling
+        markup = _render_scrollable_html(
+            df,
+            visible_rows=visible_rows,
+            max_width=max_width,
+            theme=theme,
+            freeze_cols=freeze_cols
+        )
+        display_html(markup, raw=True)
+        return
+
+    iloc = df.iloc  # cached indexer; each page is a single positional slice
+    last_offset = (total - 1) // page_size * page_size
+    state = {"offset": 0}
+
+    output = widgets.Output()
+    prev_button = widgets.Button(description="Prev", icon="arrow-left")
+    next_button = widgets.Button(description="Next", icon="arrow-right")
+
+    def show_page() -> None:
+        offset = state["offset"]
+        prev_button.disabled = offset == 0
+        next_button.disabled = offset >= last_offset
+        with output:
+            clear_output(wait=True)
+            markup = _render_scrollable_html(
+                iloc[offset:offset + page_size],
+                visible_rows=visible_rows,
+                max_width=max_width,
+                theme=theme,
+                freeze_cols=freeze_cols,
+                start=offset,
+                total=total,
+            )
+            display_html(markup, raw=True)
+
+    def on_prev(_: Any) -> None:
+        state["offset"] = max(0, state["offset"] - page_size)
+        show_page()
+
+    def on_next(_: Any) -> None:
+        state["offset"] = min(last_offset, state["offset"] + page_size)
+        show_page()
+
+    prev_button.on_click(on_prev)
+    next_button.on_click(on_next)
+
+    show_page()
+    display(widgets.VBox([widgets.HBox([prev_button, next_button]), output]))
@@ -1,35 +1,34 @@
 import sqlite3
-import pandas as pd
-import binascii
 import sys
 
+from _keywords import sql_match
+
 # Force UTF-8 encoding for stdout
 sys.stdout.reconfigure(encoding='utf-8')
 
 # Connect to DB
 db_path = r'c:\Users\yoel\constructor\prisma\dev.db'
 conn = sqlite3.connect(db_path)
+conn.row_factory = sqlite3.Row
 
 print("--- Dumping Hex of Descriptions for Sept 17 ---")
-query = """
-    SELECT id, category, description, notes, status
+query = f"""
+    SELECT id, category, COALESCE(description, '') AS description, status,
+           {sql_match('description')} AS hit
     FROM WorkItem 
     WHERE reportId=(SELECT id FROM Report WHERE reportDate=1758067200000) 
     AND apartmentId=(SELECT id FROM Apartment WHERE number='7')
 """
-df = pd.read_sql_query(query, conn)
-
-for index, row in df.iterrows():
+# The keyword check runs inside SQLite alongside the fetch
+for row in conn.execute(query):
     print(f"\nID: {row['id']}")
     print(f"  Category: {row['category']}")
     print(f"  Status: {row['status']}")
     
     # Safe printing using repr
-    desc = row['description'] if row['description'] else ""
-    print(f"  Desc Repr: {repr(desc)}")
+    print(f"  Desc Repr: {repr(row['description'])}")
     
-    # Check for keywords before hex (manual search logic)
-    if "חלקית" in desc or "sockets" in desc:
+    if row['hit']:
         print("  !!! FOUND KEYPHRASE !!!")
 
 conn.close()
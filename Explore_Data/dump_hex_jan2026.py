@@ -1,8 +1,9 @@
 import sqlite3
 import pandas as pd
-import binascii
 import sys
 
+from _keywords import sql_match
+
 # Force UTF-8 encoding for stdout
 sys.stdout.reconfigure(encoding='utf-8')
 
@@ -12,8 +13,9 @@ conn = sqlite3.connect(db_path)
 
 print("--- Dumping Hex of Descriptions for Jan 2026 ---")
 # Query for reports >= Jan 1 2026
-query = """
-    SELECT r.reportDate, wi.id, wi.category, wi.description, wi.notes, wi.status
+query = f"""
+    SELECT r.reportDate, wi.id, wi.category, COALESCE(wi.description, '') AS description,
+           wi.status, {sql_match('wi.description')} AS hit
     FROM WorkItem wi
     JOIN Report r ON wi.reportId = r.id
     JOIN Apartment a ON wi.apartmentId = a.id
@@ -24,17 +26,16 @@ query = """
 df = pd.read_sql_query(query, conn)
 df['reportDate_dt'] = pd.to_datetime(df['reportDate'], unit='ms')
 
-for index, row in df.iterrows():
-    print(f"\nDate: {row['reportDate_dt']}")
-    print(f"ID: {row['id']}")
-    print(f"  Category: {row['category']}")
-    print(f"  Status: {row['status']}")
+for row in df.itertuples(index=False):
+    print(f"\nDate: {row.reportDate_dt}")
+    print(f"ID: {row.id}")
+    print(f"  Category: {row.category}")
+    print(f"  Status: {row.status}")
     
     # Safe printing using repr
-    desc = row['description'] if row['description'] else ""
-    print(f"  Desc Repr: {repr(desc)}")
+    print(f"  Desc Repr: {repr(row.description)}")
     
-    if "חלקית" in desc or "sockets" in desc or "LAN" in desc:
+    if row.hit:
         print("  !!! FOUND KEYPHRASE !!!")
 
 conn.close()
@@ -1,8 +1,9 @@
 import sqlite3
 import pandas as pd
-import binascii
 import sys
 
+from _keywords import KEY_RE
+
 # Force UTF-8 encoding for stdout
 sys.stdout.reconfigure(encoding='utf-8')
 
@@ -24,19 +25,14 @@ query = """
 df = pd.read_sql_query(query, conn)
 df['reportDate_dt'] = pd.to_datetime(df['reportDate'], unit='ms')
 
-# Write to file directly to avoid terminal encoding hell
-with open('jan2026_data.txt', 'w', encoding='utf-8') as f:
-    for index, row in df.iterrows():
-        f.write(f"\nDate: {row['reportDate_dt']}\n")
-        f.write(f"ID: {row['id']}\n")
-        f.write(f"  Category: {row['category']}\n")
-        f.write(f"  Status: {row['status']}\n")
-        f.write(f"  Desc: {row['description']}\n")
-        
-        # Check for keywords
-        desc = str(row['description'])
-        if "חלקית" in desc or "sockets" in desc or "LAN" in desc:
-            f.write("  !!! FOUND KEYPHRASE !!!\n")
-            
+# Check for keywords in one vectorised pass instead of per row
+df['hit'] = df['description'].str.contains(KEY_RE, na=False)
+
+# Write to file directly to avoid terminal encoding hell; one tab-separated
+# row per item, keyphrase matches have hit=True
+df[['reportDate_dt', 'id', 'category', 'status', 'description', 'hit']].to_csv(
+    'jan2026_data.txt', sep='\t', index=False, encoding='utf-8'
+)
+
 conn.close()
 print("Data dumped to jan2026_data.txt")
@@ -1,5 +1,4 @@
 import sqlite3
-import pandas as pd
 import sys
 
 # Force UTF-8 encoding for stdout
@@ -8,6 +7,7 @@ sys.stdout.reconfigure(encoding='utf-8')
 # Connect to DB
 db_path = r'c:\Users\yoel\constructor\prisma\dev.db'
 conn = sqlite3.connect(db_path)
+conn.row_factory = sqlite3.Row
 
 print("--- Searching via SQL LIKE ---")
 # Using SQL LIKE to search for substring
@@ -23,10 +23,12 @@ query = """
         OR notes LIKE '%sockets%'
     )
 """
-df = pd.read_sql_query(query, conn)
+rows = conn.execute(query).fetchall()
 
-if not df.empty:
-    print(df.to_string())
+if rows:
+    print('\t'.join(rows[0].keys()))
+    for row in rows:
+        print('\t'.join(str(row[k]) for k in row.keys()))
 else:
     print("No matches found via SQL either.")
     
@@ -38,8 +40,7 @@ query_all = """
     WHERE reportId=(SELECT id FROM Report WHERE reportDate=1758067200000) 
     AND apartmentId=(SELECT id FROM Apartment WHERE number='7')
 """
-df_all = pd.read_sql_query(query_all, conn)
-for i, row in df_all.iterrows():
+for row in conn.execute(query_all):
     print(f"ID: {row['id']}")
     print(f"  Desc: {repr(row['description'])}")
     print(f"  Notes: {repr(row['notes'])}")
@@ -1,9 +1,9 @@
 import sqlite3
-import pandas as pd
 
 # Connect to DB
 db_path = r'c:\Users\yoel\constructor\prisma\dev.db'
 conn = sqlite3.connect(db_path)
+conn.row_factory = sqlite3.Row
 
 # Check Schema
 print("--- Schema of WorkItem ---")
@@ -15,21 +15,21 @@ print(columns)
 # Search for text
 print("\n--- Searching for 'partially done' or 'sockets' ---")
 query = """
-    SELECT id, description, notes, status, category, location
+    SELECT id, description, notes, status
     FROM WorkItem 
     WHERE reportId=(SELECT id FROM Report WHERE reportDate=1758067200000) 
     AND apartmentId=(SELECT id FROM Apartment WHERE number='7')
+    -- Check for "בוצע חלקית" or variants; INSTR is case-sensitive like Python's `in`
+    AND (
+        INSTR(description, 'חלקית') > 0 OR INSTR(notes, 'חלקית') > 0
+        OR INSTR(description, 'sockets') > 0 OR INSTR(notes, 'sockets') > 0
+    )
 """
-df = pd.read_sql_query(query, conn)
-
-# Simple text search
-for index, row in df.iterrows():
-    text_blob = str(row['description']) + " " + str(row['notes'])
-    # Check for "בוצע חלקית" or variants
-    if "חלקית" in text_blob or "sockets" in text_blob:
-         print(f"FOUND MATCH in Item {row['id']}:")
-         print(f"  Desc: {row['description']}")
-         print(f"  Notes: {row['notes']}")
-         print(f"  Status: {row['status']}")
+# Only the matching rows leave SQLite
+for row in conn.execute(query):
+    print(f"FOUND MATCH in Item {row['id']}:")
+    print(f"  Desc: {row['description']}")
+    print(f"  Notes: {row['notes']}")
+    print(f"  Status: {row['status']}")
 
 conn.close()
@@ -1,13 +1,17 @@
 import sqlite3
-import uuid
+from secrets import token_hex
 
 # Connect to DB
 db_path = r'c:\Users\yoel\constructor\prisma\dev.db'
 conn = sqlite3.connect(db_path)
+# WAL + NORMAL sync: the single commit below costs one WAL fsync, not a journal rewrite
+conn.execute("PRAGMA journal_mode=WAL")
+conn.execute("PRAGMA synchronous=NORMAL")
 cursor = conn.cursor()
 
 def generate_cuid():
-    return 'cj' + str(uuid.uuid4()).replace('-', '')[:23]
+    # 25 chars like a Prisma cuid: "cj" + 23 hex chars from one urandom read
+    return 'cj' + token_hex(12)[:23]
 
 print("--- Applying Fixes for Jan 2026 Data ---")
 
@@ -23,6 +27,12 @@ new_items_desc = [
     "בדיקת תוכנית חשמל - חסרות נקודות תקשורת LAN - סלון"
 ]
 
+# Collect all writes first, then apply them in one transaction
+updates: list[tuple] = []
+inserts: list[tuple] = []
+# Reported only once the transaction has committed
+applied: list[str] = []
+
 for item_id in target_ids:
     # Check if exists
     cursor.execute("SELECT reportId, apartmentId, location, description FROM WorkItem WHERE id=?", (item_id,))
@@ -33,20 +43,27 @@ for item_id in target_ids:
         
         # Rename original to Kitchen
         new_desc_main = "בדיקת תוכנית חשמל - חסרות נקודות תקשורת LAN - מטבח (דרוש חור)"
-        cursor.execute("UPDATE WorkItem SET description=? WHERE id=?", (new_desc_main, item_id))
-        print(f"  Updated original item description")
+        updates.append((new_desc_main, item_id))
+        applied.append(f"Updated item {item_id} description")
         
         # Create 3 new items
         for desc in new_items_desc:
-            nid = generate_cuid()
-            cursor.execute("""
-                INSERT INTO WorkItem (id, reportId, apartmentId, category, status, location, description, notes, createdAt, updatedAt)
-                VALUES (?, ?, ?, 'ELECTRICAL', 'DEFECT', ?, ?, 'פוצל מסעיף בדיקת תוכנית חשמל (תיקון ינואר)', 1767225600000, 1767225600000)
-            """, (nid, rep_id, apt_id, loc, desc))
-            print(f"  Created new item: {desc}")
+            new_id = generate_cuid()
+            inserts.append((new_id, rep_id, apt_id, loc, desc))
+            applied.append(f"Created new item ({new_id}): {desc}")
     else:
         print(f"Item {item_id} not found (maybe already fixed?)")
 
-conn.commit()
+# Commits once on success, rolls everything back on error
+with conn:
+    cursor.executemany("UPDATE WorkItem SET description=? WHERE id=?", updates)
+    cursor.executemany("""
+        INSERT INTO WorkItem (id, reportId, apartmentId, category, status, location, description, notes, createdAt, updatedAt)
+        VALUES (?, ?, ?, 'ELECTRICAL', 'DEFECT', ?, ?, 'פוצל מסעיף בדיקת תוכנית חשמל (תיקון ינואר)', 1767225600000, 1767225600000)
+    """, inserts)
+
+for line in applied:
+    print(f"  {line}")
+
 conn.close()
 print("--- Fixes Applied Successfully ---")
@@ -1,20 +1,30 @@
 import sqlite3
-import uuid
+from secrets import token_hex
 
 # Connect to DB
 db_path = r'c:\Users\yoel\constructor\prisma\dev.db'
 conn = sqlite3.connect(db_path)
+# WAL + NORMAL sync: the single commit below costs one WAL fsync, not a journal rewrite
+conn.execute("PRAGMA journal_mode=WAL")
+conn.execute("PRAGMA synchronous=NORMAL")
 cursor = conn.cursor()
 
 def generate_cuid():
-    return 'cj' + str(uuid.uuid4()).replace('-', '')[:23] # Mock CUID-like string
+    # 25 chars like a Prisma cuid: "cj" + 23 hex chars from one urandom read
+    return 'cj' + token_hex(12)[:23]
 
 print("--- Applying Fixes for Sept 17 Data ---")
 
+# New items are collected as (id, reportId, apartmentId, category, location, description, notes)
+# and inserted in one batch; the whole fix runs in a single transaction
+inserts: list[tuple] = []
+# Reported only once the transaction has committed
+applied: list[str] = []
+
 # 1. Update Item 2 (Flooring) to DEFECT
 item2_id = 'cmkpajlja00cp13u5rrhoqkek'
 cursor.execute("UPDATE WorkItem SET status='DEFECT' WHERE id=?", (item2_id,))
-print(f"Updated Item 2 ({item2_id}) status to DEFECT")
+applied.append(f"Updated Item 2 ({item2_id}) status to DEFECT")
 
 # 2. Create new Flooring item from Item 4 (Electrical)
 item4_id = 'cmkpajljs00ct13u5uugwyf4q'
@@ -25,11 +35,8 @@ if res:
     rep_id, apt_id, loc = res
     new_id = generate_cuid()
     desc = "נזק לריצוף/בטון עקב העברת כבל חשמל (מתוך סעיף חשמל)"
-    cursor.execute("""
-        INSERT INTO WorkItem (id, reportId, apartmentId, category, status, location, description, notes, createdAt, updatedAt)
-        VALUES (?, ?, ?, 'FLOORING', 'DEFECT', ?, ?, 'נוצר אוטומטית בעקבות הערה בסעיף חשמל', 1758067200000, 1758067200000)
-    """, (new_id, rep_id, apt_id, loc, desc))
-    print(f"Created new Flooring item ({new_id}) from Electrical Item 4")
+    inserts.append((new_id, rep_id, apt_id, 'FLOORING', loc, desc, 'נוצר אוטומטית בעקבות הערה בסעיף חשמל'))
+    applied.append(f"Created new Flooring item ({new_id}) from Electrical Item 4")
 
 # 3. Split Item 8 (Electrical) into 4 items
 item8_id = 'cmkpalfue00kr5sxqrqze6k7l'
@@ -41,7 +48,7 @@ if res:
     # Rename original
     new_desc_main = "בדיקת תוכנית חשמל - חסרות נקודות תקשורת LAN - מטבח (דרוש חור)"
     cursor.execute("UPDATE WorkItem SET description=? WHERE id=?", (new_desc_main, item8_id))
-    print(f"Updated Item 8 ({item8_id}) description")
+    applied.append(f"Updated Item 8 ({item8_id}) description")
     
     # Create 3 new items
     new_items = [
@@ -52,12 +59,18 @@ if res:
     
     for desc in new_items:
         nid = generate_cuid()
-        cursor.execute("""
-            INSERT INTO WorkItem (id, reportId, apartmentId, category, status, location, description, notes, createdAt, updatedAt)
-            VALUES (?, ?, ?, 'ELECTRICAL', 'DEFECT', ?, ?, 'פוצל מסעיף בדיקת תוכנית חשמל', 1758067200000, 1758067200000)
-        """, (nid, rep_id, apt_id, loc, desc))
-        print(f"Created new Electrical item ({nid}): {desc}")
+        inserts.append((nid, rep_id, apt_id, 'ELECTRICAL', loc, desc, 'פוצל מסעיף בדיקת תוכנית חשמל'))
+        applied.append(f"Created new Electrical item ({nid}): {desc}")
+
+cursor.executemany("""
+    INSERT INTO WorkItem (id, reportId, apartmentId, category, status, location, description, notes, createdAt, updatedAt)
+    VALUES (?, ?, ?, ?, 'DEFECT', ?, ?, ?, 1758067200000, 1758067200000)
+""", inserts)
 
 conn.commit()
+
+for line in applied:
+    print(line)
+
 conn.close()
 print("--- Fixes Applied Successfully ---")
@@ -1,5 +1,4 @@
 import sqlite3
-import pandas as pd
 
 db_path = r'c:\Users\yoel\constructor\prisma\dev.db'
 conn = sqlite3.connect(db_path)
@@ -4,8 +4,6 @@
 import matplotlib
 matplotlib.use('Agg')  # Non-interactive backend
 import matplotlib.pyplot as plt
-import seaborn as sns
-import numpy as np
 import sqlite3
 import pandas as pd
 import os
@@ -11,8 +11,7 @@ query = """
         r.reportDate,
         w.category, 
         w.location, 
-        w.status,
-        w.description
+        w.status
     FROM WorkItem w
     JOIN Report r ON w.reportId = r.id
     JOIN Apartment a ON w.apartmentId = a.id
@@ -23,9 +23,8 @@ print(reports[['reportDate_dt', 'fileName', 'id']])
 
 # Now for each report, count items and defects
 print("\n--- Item Counts per Report ---")
-for _, row in reports.iterrows():
-    r_id = row['id']
-    date_str = row['reportDate_dt'].strftime('%Y-%m-%d')
+for r_id, report_dt in reports[['id', 'reportDate_dt']].itertuples(index=False, name=None):
+    date_str = report_dt.strftime('%Y-%m-%d')
     
     query_items = f"""
         SELECT status, COUNT(*) as count
@@ -44,7 +43,7 @@ for _, row in reports.iterrows():
         # Get sample items
         q_sample = f"SELECT category, description, status, notes FROM WorkItem WHERE reportId = '{r_id}' LIMIT 5"
         sample = pd.read_sql_query(q_sample, conn)
-        for _, s_row in sample.iterrows():
-            print(f"    - [{s_row['status']}] {s_row['description'][:50]}... (Notes: {s_row['notes']})")
+        for status, description, notes in sample[['status', 'description', 'notes']].itertuples(index=False, name=None):
+            print(f"    - [{status}] {description[:50]}... (Notes: {notes})")
 
 conn.close()
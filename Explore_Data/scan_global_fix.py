@@ -13,7 +13,6 @@ print("--- Scanning for 'Partially Done' (חלקית) items marked COMPLETED ---
 
 query = """
     SELECT 
-        wi.id,
         wi.description,
         wi.notes,
         wi.status,
@@ -0,0 +1,56 @@
+"""
+Checks that the fast table renderer in display.py matches DataFrame.to_html.
+
+    python -m pytest test_display.py
+"""
+
+import re
+
+import pandas as pd
+
+import display
+
+
+def _thead(markup: str) -> str:
+    """The <thead> section with the whitespace between tags removed"""
+    markup = re.sub(r">\s+<", "><", markup)
+    return markup[markup.index("<thead>"):markup.index("</thead>")]
+
+
+def _both_heads(df: pd.DataFrame) -> tuple[str, str]:
+    fast = display._fast_to_html(df, "t")
+    slow = df.to_html(classes="t", border=0, notebook=False)
+    return _thead(fast), _thead(slow)
+
+
+def test_named_columns_header_matches_to_html():
+    df = pd.DataFrame({"a": [1, 2], "b": [3, 4]})
+    df.columns.name = "cols"
+    fast, slow = _both_heads(df)
+    assert fast == slow
+    assert "<th>cols</th>" in fast
+
+
+def test_named_columns_and_index_header_matches_to_html():
+    df = pd.DataFrame({"a": [1, 2], "b": [3, 4]})
+    df.columns.name = "cols"
+    df.index.name = "apt"
+    fast, slow = _both_heads(df)
+    assert fast == slow
+
+
+def test_cache_misses_on_columns_name_rename():
+    display._html_cache.clear()
+    df = pd.DataFrame({"a": [1, 2], "b": [3, 4]})
+    df.columns.name = "cols"
+    first = display._cached_to_html(df)
+    # Same frame again: served from the cache
+    assert display._cached_to_html(df) is first
+    assert len(display._html_cache) == 1
+
+    renamed = df.copy()
+    renamed.columns.name = "other"
+    second = display._cached_to_html(renamed)
+    assert second != first
+    assert "<th>other</th>" in second
+    assert len(display._html_cache) == 2
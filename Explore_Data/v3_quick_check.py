@@ -2,12 +2,19 @@
 Quick V3 impact calculation - simplified version
 """
 import sqlite3
-import pandas as pd
 
 db_path = r'c:\Users\yoel\constructor\prisma\dev.db'
 conn = sqlite3.connect(db_path)
+# Same read tuning as db_utils.get_conn, plus in-memory temp storage for the
+# ORDER BY reportDate sort; applied directly so this script stays pandas-free
+conn.execute("PRAGMA journal_mode=WAL")
+conn.execute("PRAGMA cache_size=-65536")  # 64 MB page cache
+conn.execute("PRAGMA mmap_size=268435456")  # 256 MB memory map
+conn.execute("PRAGMA temp_store=MEMORY")
+conn.execute("PRAGMA query_only=ON")
 
-NEGATIVE_KEYWORDS = [
+# Lowercased once here; only the English ones need case-insensitive matching
+NEGATIVE_KEYWORDS = tuple(kw.lower() for kw in (
     'אי תיאומים', 'אי תאומים', 'נמצאו אי', 'קיימים אי',
     'יש הערות', 'יש ליקויים', 'ליקוי', 'ליקויים',
     'לא תקין', 'חסר', 'חסרות', 'חסרים', 'חסרה',
@@ -15,73 +22,90 @@ NEGATIVE_KEYWORDS = [
     'פגם', 'פגמים', 'בעיה', 'בעיות', 'לתקן', 'תיקון', 'תיקונים',
     'לא בוצע', 'לא הותקן', 'לא הותקנו', 'לא הושלם',
     'נזק', 'נזקים', 'missing', 'defect', 'חתוך', 'להחליף',
-]
+))
 
-def has_negative_notes(notes):
-    if not notes:
-        return False
-    notes_lower = notes.lower()
-    return any(kw.lower() in notes_lower for kw in NEGATIVE_KEYWORDS)
+NEGATIVE_STATUSES = ['DEFECT', 'NOT_OK']
+POSITIVE_STATUSES = ['COMPLETED', 'COMPLETED_OK', 'HANDLED']
 
-def get_apt_stats(apt_num):
-    # Get apartment ID
-    apt_df = pd.read_sql_query("SELECT id FROM Apartment WHERE number = ?", conn, params=(str(apt_num),))
-    if apt_df.empty:
-        return None
-    apt_id = apt_df.iloc[0]['id']
-    
-    # Get latest items
-    query = """
-    SELECT wi.status, wi.notes
-    FROM WorkItem wi
+# Hebrew has no case, so those keywords are matched on the raw notes with
+# INSTR. The few English ones use LIKE, which folds ASCII case itself, so no
+# lowercased copy of the notes is ever built.
+_NEG_KEYWORDS_HEBREW = tuple(kw for kw in NEGATIVE_KEYWORDS if not kw.isascii())
+_NEG_KEYWORDS_ASCII = tuple(kw for kw in NEGATIVE_KEYWORDS if kw.isascii())
+
+APARTMENTS = ['7', '11']
+
+# Counts the latest 100 items of every apartment in APARTMENTS in a single
+# query, entirely inside SQLite, so only one row of totals per apartment comes
+# back. Apartment numbers and keywords are bound as parameters, in
+# _STATS_PARAMS order.
+_STATS_QUERY = f"""
+WITH apartments AS (
+    -- Numbers are only unique per project; take one apartment per number
+    SELECT number, MIN(id) AS id
+    FROM Apartment
+    WHERE number IN ({', '.join('?' * len(APARTMENTS))})
+    GROUP BY number
+),
+ranked AS (
+    SELECT
+        a.number,
+        wi.status,
+        COALESCE(wi.notes, '') AS notes,
+        -- Assume first batch is from latest report
+        ROW_NUMBER() OVER (PARTITION BY a.id ORDER BY r.reportDate DESC) AS rn
+    FROM apartments a
+    JOIN WorkItem wi ON wi.apartmentId = a.id
     JOIN Report r ON wi.reportId = r.id
-    WHERE wi.apartmentId = ?
-    ORDER BY r.reportDate DESC
-    """
-    all_items = pd.read_sql_query(query, conn, params=(apt_id,))
-    if all_items.empty:
-        return None
-    
-    # Get latest report items
-    latest_items = all_items.head(100)  # Assume first batch is from latest report
-    
-    # Count defects
-    v2_defects = 0
-    v3_defects = 0
-    items_with_positive_status_but_negative_notes = 0
-    
-    for _, item in latest_items.iterrows():
-        status = item['status']
-        notes = item['notes']
-        
-        # V2 logic
-        is_negative_status = status in ['DEFECT', 'NOT_OK']
-        is_positive_status = status in ['COMPLETED', 'COMPLETED_OK', 'HANDLED']
-        has_neg_notes = has_negative_notes(notes)
-        
-        if is_negative_status or (is_positive_status and has_neg_notes):
-            v2_defects += 1
-        
+),
+flagged AS (
+    SELECT
+        number,
+        status IN ({', '.join('?' * len(NEGATIVE_STATUSES))}) AS is_negative_status,
+        status IN ({', '.join('?' * len(POSITIVE_STATUSES))}) AS is_positive_status,
+        ({' OR '.join(['INSTR(notes, ?) > 0'] * len(_NEG_KEYWORDS_HEBREW)
+                      + ['notes LIKE ?'] * len(_NEG_KEYWORDS_ASCII))}) AS has_neg_notes
+    FROM ranked
+    WHERE rn <= 100
+)
+SELECT
+    number,
+    COUNT(*),
+    SUM(is_negative_status OR (is_positive_status AND has_neg_notes)),
+    SUM(is_positive_status AND has_neg_notes)
+FROM flagged
+GROUP BY number
+"""
+_STATS_PARAMS = (
+    *APARTMENTS, *NEGATIVE_STATUSES, *POSITIVE_STATUSES,
+    *_NEG_KEYWORDS_HEBREW, *(f'%{kw}%' for kw in _NEG_KEYWORDS_ASCII),
+)
+
+def get_apt_stats():
+    """Return {apartment number: stats} for the APARTMENTS that have work items"""
+    # Count defects in SQL; V2 logic counts negative statuses plus the special
+    # case of positive status but negative notes
+    all_stats = {}
+    for apt, total_items, v2_defects, items_with_positive_status_but_negative_notes in conn.execute(
+        _STATS_QUERY, _STATS_PARAMS
+    ):
+        stats = {
+            'apt': apt,
+            'total_items': total_items,
+            'v2_defects': v2_defects,
+            'special_cases': items_with_positive_status_but_negative_notes
+        }
         # V3 logic (same as V2 - they're identical!)
-        v3_defects = v2_defects
-        
-        # Track special case
-        if is_positive_status and has_neg_notes:
-            items_with_positive_status_but_negative_notes += 1
-    
-    return {
-        'apt': apt_num,
-        'total_items': len(latest_items),
-        'v2_defects': v2_defects,
-        'v3_defects': v3_defects,
-        'special_cases': items_with_positive_status_but_negative_notes
-    }
+        stats['v3_defects'] = stats['v2_defects']
+        all_stats[apt] = stats
+    return all_stats
 
 print("V2 vs V3 Defect Detection Comparison")
 print("=" * 60)
 
-for apt in ['7', '11']:
-    stats = get_apt_stats(apt)
+all_stats = get_apt_stats()
+for apt in APARTMENTS:
+    stats = all_stats.get(apt)
     if stats:
         print(f"\nApartment {apt}:")
         print(f"  Total items: {stats['total_items']}")
@@ -1,4 +1,5 @@
 import sqlite3
+import numpy as np
 import pandas as pd
 
 # Connect to DB
@@ -19,30 +20,51 @@ WHERE a.number = '7'
 ORDER BY r.reportDate ASC
 """
 
-df_progress = pd.read_sql_query(query, conn)
-# Convert reportDate
-df_progress['reportDate'] = pd.to_datetime(df_progress['reportDate'], unit='ms')
+# Dtypes given up front: the grouping keys become integer category codes
+# instead of per-row strings, and status arrives ready for the .str checks
+df_progress = pd.read_sql_query(query, conn, dtype={
+    'apartment_number': 'category',
+    'category': 'category',
+    'status': 'string',
+})
 
 # 2. Data Processing (Cell 12 logic)
 COMPLETED_STATUSES = ['COMPLETED', 'DONE', 'OK', 'בוצע', 'תקין', 'בוצע - תקין'] 
 
-def is_done(status):
-    if not isinstance(status, str):
-        return 0
-    return 1 if status in COMPLETED_STATUSES or 'COMPLETED' in status.upper() or 'DONE' in status.upper() else 0
-
-df_progress['is_completed'] = df_progress['status'].apply(is_done)
+# Vectorized over the column; missing/non-text statuses count as not done
+status = df_progress['status']
+status_upper = status.str.upper()
+df_progress['is_completed'] = (
+    status.isin(COMPLETED_STATUSES)
+    | status_upper.str.contains('COMPLETED', regex=False, na=False)
+    | status_upper.str.contains('DONE', regex=False, na=False)
+).astype('int8')
 
 # Group
-df_grouped = df_progress.groupby(['apartment_number', 'category', 'reportDate'])['is_completed'].sum().reset_index()
+df_grouped = df_progress.groupby(['apartment_number', 'category', 'reportDate'], observed=True)['is_completed'].sum().reset_index()
+
+# Convert reportDate from timestamp (ms) to datetime on the aggregated rows only
+df_grouped['reportDate'] = pd.to_datetime(df_grouped['reportDate'], unit='ms')
 
 # Sort
 df_grouped.sort_values(['apartment_number', 'category', 'reportDate'], inplace=True)
 
 # Cumulative Sum
-df_grouped['cumulative_completed'] = df_grouped.groupby(['apartment_number', 'category'])['is_completed'].transform(pd.Series.cumsum)
+# Rows are sorted by group, so one running total over the whole column minus
+# the total reached before each group's first row gives the per-group cumsum
+completed = df_grouped['is_completed'].to_numpy()
+apt_codes = df_grouped['apartment_number'].cat.codes.to_numpy()
+category_codes = df_grouped['category'].cat.codes.to_numpy()
+group_start = np.ones(len(completed), dtype=bool)
+group_start[1:] = (apt_codes[1:] != apt_codes[:-1]) | (category_codes[1:] != category_codes[:-1])
+running = np.cumsum(completed)
+offsets = np.maximum.accumulate(np.where(group_start, running - completed, 0))
+df_grouped['cumulative_completed'] = running - offsets
 
 print("--- Data for Apt 7 ---")
-print(df_grouped.to_string())
+# Stream the rows instead of rendering the whole frame into one string
+print(*df_grouped.columns, sep='\t')
+for row in df_grouped.itertuples(index=False, name=None):
+    print(*row, sep='\t')
 
 conn.close()